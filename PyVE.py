@@ -1,516 +1,905 @@
-import sys
-import re
-import os
-from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QLabel,
-                             QMessageBox, QProgressBar, QTabWidget, QPushButton,
-                             QHBoxLayout, QListWidget, QSpacerItem, QSizePolicy,
-                             QListWidgetItem, QTabBar)
-from PyQt5.QtGui import QPalette, QColor, QFont, QBrush
-from PyQt5.QtCore import Qt, QTimer, QPoint
-from proxmoxer import ResourceException, ProxmoxAPI
-import logging
-
-# Configuration (use environment variables for security)
-PROXMOX_HOST = os.getenv('PROXMOX_HOST', 'your_proxmox_ip')
-PROXMOX_PORT = int(os.getenv('PROXMOX_PORT', 8006))
-PROXMOX_USER = os.getenv('PROXMOX_USER', 'your_user') #Example User: root@pam
-PROXMOX_PASSWORD = os.getenv('PROXMOX_PASSWORD', 'your_password')
-PROXMOX_NODE = os.getenv('PROXMOX_NODE', 'pve')
-VERIFY_SSL = os.getenv('PROXMOX_VERIFY_SSL', 'False').lower() == 'true'
-UPDATE_INTERVAL_MS = 10000  # Increased to 10 seconds to reduce API load
-
-# Configure logging to console and file
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('monitor_app.log'),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
-
-# Global Proxmox connection
-proxmox = None
-connection_error_details = None
-
-def initialize_proxmox_connection():
-    """Initialize connection to Proxmox server with retry logic."""
-    global proxmox, connection_error_details
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            if not VERIFY_SSL:
-                import urllib3
-                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            proxmox = ProxmoxAPI(PROXMOX_HOST, port=PROXMOX_PORT, user=PROXMOX_USER,
-                                 password=PROXMOX_PASSWORD, verify_ssl=VERIFY_SSL, timeout=10)
-            proxmox.version.get()  # Test connection
-            logger.info(f"Connected to Proxmox host {PROXMOX_HOST} on node {PROXMOX_NODE}")
-            return True
-        except Exception as e:
-            connection_error_details = f"Proxmox connection error (attempt {attempt + 1}/{max_retries}): {e}"
-            logger.error(connection_error_details)
-            if attempt < max_retries - 1:
-                import time
-                time.sleep(2)  # Wait before retrying
-    return False
-
-class ScrollableTabBar(QTabBar):
-    """Custom QTabBar with mouse/touch drag scrolling."""
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setUsesScrollButtons(True)
-        self._drag_start_pos = None
-        self._scroll_offset = 0
-        self.setMouseTracking(True)
-
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self._drag_start_pos = event.pos()
-        super().mousePressEvent(event)
-
-    def mouseMoveEvent(self, event):
-        if self._drag_start_pos is not None:
-            delta = event.pos().x() - self._drag_start_pos.x()
-            self._scroll_offset -= delta
-            self._drag_start_pos = event.pos()
-            self.update_scroll_position()
-        super().mouseMoveEvent(event)
-
-    def mouseReleaseEvent(self, event):
-        self._drag_start_pos = None
-        super().mouseReleaseEvent(event)
-
-    def update_scroll_position(self):
-        total_width = sum(self.tabRect(i).width() for i in range(self.count()))
-        visible_width = self.width()
-
-        if total_width <= visible_width:
-            self._scroll_offset = 0
-        else:
-            max_offset = total_width - visible_width
-            self._scroll_offset = max(0, min(self._scroll_offset, max_offset))
-
-        self.update()  # Changed from repaint() to reduce flickering
-
-class MonitorApp(QWidget):
-    """Main application window for Proxmox monitoring and management."""
-    
-    def __init__(self):
-        super().__init__()
-        self.set_dark_theme()
-        self.init_ui()
-        self.setup_update_timer()
-
-    def set_dark_theme(self):
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(45, 45, 45))
-        palette.setColor(QPalette.WindowText, Qt.white)
-        palette.setColor(QPalette.Base, QColor(35, 35, 35))
-        palette.setColor(QPalette.Button, QColor(65, 65, 65))
-        palette.setColor(QPalette.ButtonText, Qt.white)
-        palette.setColor(QPalette.Text, Qt.white)
-        palette.setColor(QPalette.Highlight, QColor(85, 85, 85))
-        palette.setColor(QPalette.HighlightedText, Qt.white)
-        self.setPalette(palette)
-        app = QApplication.instance()
-        if app:
-            app.setPalette(palette)
-
-    def init_ui(self):
-        self.setWindowTitle("PyVE Manager")
-        self.setWindowFlags(Qt.FramelessWindowHint)
-        self.setStyleSheet(self.get_stylesheet())
-        
-        # Main layout
-        main_layout = QVBoxLayout()
-        main_layout.setContentsMargins(5, 5, 5, 5)
-        main_layout.setSpacing(5)
-
-        # Tab widget with custom scrollable tab bar
-        self.tabs = QTabWidget()
-        self.tabs.setTabBar(ScrollableTabBar())
-        self.tabs.setMovable(False)
-        self.tabs.setTabsClosable(False)
-
-        self.pyve_tab = QWidget()
-        self.vm_tab = QWidget()
-        self.container_tab = QWidget()
-        self.exit_tab = QWidget()
-
-        self.tabs.addTab(self.pyve_tab, "PyVE")
-        self.tabs.addTab(self.vm_tab, "VMs")
-        self.tabs.addTab(self.container_tab, "CTs")
-        self.exit_tab_index = self.tabs.addTab(self.exit_tab, "Exit")
-
-        self.tabs.currentChanged.connect(self.on_tab_changed)
-
-        main_layout.addWidget(self.tabs)
-        self.setLayout(main_layout)
-
-        # Initialize tab contents
-        self.vm_list = QListWidget()
-        self.container_list = QListWidget()
-        self.init_pyve_tab()
-        self.init_vm_tab()
-        self.init_container_tab()
-
-    def get_stylesheet(self):
-        return """
-            QWidget { font-size: 14pt; }
-            QPushButton { 
-                padding: 6px; border: 1px solid #555; border-radius: 4px; 
-                min-width: 100px; min-height: 40px; font-size: 14pt; color: white;
-            }
-            QPushButton:hover { border-color: #777; }
-            QPushButton:pressed { border-color: #999; }
-            QPushButton#startButton { 
-                background-color: #4CAF50; color: black; font-weight: bold;
-            }
-            QPushButton#startButton:hover { background-color: #66BB6A; }
-            QPushButton#startButton:pressed { background-color: #388E3C; }
-            QPushButton#stopButton { 
-                background-color: #F44336; color: black; font-weight: bold;
-            }
-            QPushButton#stopButton:hover { background-color: #EF5350; }
-            QPushButton#stopButton:pressed { background-color: #D32F2F; }
-            QPushButton#rebootButton { 
-                background-color: #FFEB3B; color: black; font-weight: bold;
-            }
-            QPushButton#rebootButton:hover { background-color: #FFF176; }
-            QPushButton#rebootButton:pressed { background-color: #FBC02D; }
-            QPushButton#shutdownButton { 
-                background-color: #FF9800; color: black; font-weight: bold;
-            }
-            QPushButton#shutdownButton:hover { background-color: #FFA726; }
-            QPushButton#shutdownButton:pressed { background-color: #F57C00; }
-            QListWidget { 
-                border: 1px solid #4a4a4a; border-radius: 4px; font-size: 16pt; font-weight: bold;
-            }
-            QListWidget::item { height: 60px; }
-            QTabWidget::pane { 
-                border: 1px solid #4a4a4a; background-color: #353535; 
-            }
-            QTabBar::tab { 
-                background-color: #505050; color: white; padding: 8px 16px;
-                border: 1px solid #4a4a4a; border-bottom: none; 
-                border-top-left-radius: 4px; border-top-right-radius: 4px; 
-                font-size: 14pt; min-width: 80px; min-height: 32px; font-weight: bold;
-            }
-            QTabBar::tab:selected { 
-                background-color: #42a5f5; color: white; border-bottom: 1px solid #42a5f5; 
-            }
-            QTabBar::tab:!selected:hover { background-color: #5e5e5e; }
-            QTabBar::tab:last { 
-                background-color: #505050; 
-            }
-            QTabBar::tab:last:selected { 
-                background-color: #F44336;
-            }
-            QTabBar::tab:last:!selected:hover { 
-                background-color: #EF5350;
-            }
-            QTabBar::scroller { 
-                width: 80px; 
-            }
-            QTabBar::left-arrow, QTabBar::right-arrow { 
-                width: 48px; height: 48px; background: #505050; 
-                border: 1px solid #4a4a4a; border-radius: 4px; 
-            }
-            QTabBar::left-arrow:hover, QTabBar::right-arrow:hover { 
-                background: #5e5e5e; 
-            }
-            QTabBar::left-arrow:pressed, QTabBar::right-arrow:pressed { 
-                background: #777; 
-            }
-            QLabel { background-color: transparent; font-size: 14pt; }
-            QProgressBar { 
-                border: 1px solid grey; border-radius: 4px; text-align: center; 
-                background-color: #3a3a3a; height: 36px; font-size: 12pt;
-            }
-            QProgressBar::chunk { border-radius: 4px; }
-            #CpuBar::chunk { background-color: #42a5f5; }
-            #RamBar::chunk { background-color: #ef5350; }
-            #DiskBar::chunk { background-color: #66bb6a; }
-            #IoDelayBar::chunk { background-color: #ffca28; }
-        """
-
-    def setup_update_timer(self):
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_stats)
-        self.update_timer.start(UPDATE_INTERVAL_MS)
-        QTimer.singleShot(150, self.update_stats)
-
-    def on_tab_changed(self, index):
-        if index == self.exit_tab_index:
-            QApplication.quit()
-
-    def init_pyve_tab(self):
-        layout = QVBoxLayout(self.pyve_tab)
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(10)
-
-        layout.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Fixed))
-
-        stats_font = QFont()
-        stats_font.setPointSize(14)
-        stats_font.setBold(True)
-
-        initial_state = "Connecting..." if proxmox else "Error"
-        initial_cores_threads = "Fetching..." if proxmox else "N/A"
-        enabled = bool(proxmox)
-
-        self.pyve_cpu_label = QLabel(f'CPU ({initial_cores_threads})')
-        self.pyve_cpu_label.setFont(stats_font)
-        self.pyve_cpu_bar = QProgressBar()
-        self.pyve_cpu_bar.setObjectName("CpuBar")
-        self.pyve_cpu_bar.setTextVisible(True)
-        self.pyve_cpu_bar.setFormat("%p%")
-        self.pyve_cpu_bar.setValue(0)
-        self.pyve_cpu_bar.setEnabled(enabled)
-        layout.addWidget(self.pyve_cpu_label)
-        layout.addWidget(self.pyve_cpu_bar)
-
-        self.pyve_ram_label = QLabel(f'RAM: {initial_state}')
-        self.pyve_ram_label.setFont(stats_font)
-        self.pyve_ram_bar = QProgressBar()
-        self.pyve_ram_bar.setObjectName("RamBar")
-        self.pyve_ram_bar.setTextVisible(True)
-        self.pyve_ram_bar.setFormat("%p%")
-        self.pyve_ram_bar.setValue(0)
-        self.pyve_ram_bar.setEnabled(enabled)
-        layout.addWidget(self.pyve_ram_label)
-        layout.addWidget(self.pyve_ram_bar)
-
-        self.pyve_disk_label = QLabel(f'Disk: {initial_state}')
-        self.pyve_disk_label.setFont(stats_font)
-        self.pyve_disk_bar = QProgressBar()
-        self.pyve_disk_bar.setObjectName("DiskBar")
-        self.pyve_disk_bar.setTextVisible(True)
-        self.pyve_disk_bar.setFormat("%p%")
-        self.pyve_disk_bar.setValue(0)
-        self.pyve_disk_bar.setEnabled(enabled)
-        layout.addWidget(self.pyve_disk_label)
-        layout.addWidget(self.pyve_disk_bar)
-
-        self.pyve_iodelay_label = QLabel(f'I/O Delay: {initial_state}')
-        self.pyve_iodelay_label.setFont(stats_font)
-        self.pyve_iodelay_bar = QProgressBar()
-        self.pyve_iodelay_bar.setObjectName("IoDelayBar")
-        self.pyve_iodelay_bar.setTextVisible(True)
-        self.pyve_iodelay_bar.setFormat("%p%")
-        self.pyve_iodelay_bar.setValue(0)
-        self.pyve_iodelay_bar.setEnabled(enabled)
-        layout.addWidget(self.pyve_iodelay_label)
-        layout.addWidget(self.pyve_iodelay_bar)
-
-        layout.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Expanding))
-
-        if not proxmox:
-            self.set_error_state()
-
-    def set_error_state(self):
-        self.pyve_cpu_label.setText("CPU (N/A)")
-        self.pyve_ram_label.setText("RAM: Error")
-        self.pyve_disk_label.setText("Disk: Error")
-        self.pyve_iodelay_label.setText("I/O Delay: Error")
-
-    def init_vm_tab(self):
-        layout = QVBoxLayout(self.vm_tab)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(5)
-        
-        self.vm_list.setWordWrap(True)
-        layout.addWidget(self.vm_list)
-
-        buttons_layout = QHBoxLayout()
-        buttons_layout.setSpacing(8)
-        
-        self.vm_start_button = QPushButton('Start')
-        self.vm_start_button.setObjectName("startButton")
-        self.vm_stop_button = QPushButton('Stop')
-        self.vm_stop_button.setObjectName("stopButton")
-        self.vm_restart_button = QPushButton('Reboot')
-        self.vm_restart_button.setObjectName("rebootButton")
-        self.vm_shutdown_button = QPushButton('Shutdown')
-        self.vm_shutdown_button.setObjectName("shutdownButton")
-
-        for btn in (self.vm_start_button, self.vm_stop_button, 
-                   self.vm_restart_button, self.vm_shutdown_button):
-            buttons_layout.addWidget(btn)
-        layout.addLayout(buttons_layout)
-
-        self.vm_start_button.clicked.connect(self.start_vm)
-        self.vm_stop_button.clicked.connect(self.stop_vm)
-        self.vm_restart_button.clicked.connect(self.reboot_vm)
-        self.vm_shutdown_button.clicked.connect(self.shutdown_vm)
-
-        # Disable buttons when no item is selected
-        self.vm_list.itemSelectionChanged.connect(self.update_vm_button_state)
-        self.update_vm_button_state()
-
-    def init_container_tab(self):
-        layout = QVBoxLayout(self.container_tab)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(5)
-        
-        self.container_list.setWordWrap(True)
-        layout.addWidget(self.container_list)
-
-        buttons_layout = QHBoxLayout()
-        buttons_layout.setSpacing(8)
-        
-        self.container_start_button = QPushButton('Start')
-        self.container_start_button.setObjectName("startButton")
-        self.container_stop_button = QPushButton('Stop')
-        self.container_stop_button.setObjectName("stopButton")
-        self.container_restart_button = QPushButton('Reboot')
-        self.container_restart_button.setObjectName("rebootButton")
-        self.container_shutdown_button = QPushButton('Shutdown')
-        self.container_shutdown_button.setObjectName("shutdownButton")
-
-        for btn in (self.container_start_button, self.container_stop_button,
-                   self.container_restart_button, self.container_shutdown_button):
-            buttons_layout.addWidget(btn)
-        layout.addLayout(buttons_layout)
-
-        self.container_start_button.clicked.connect(self.start_container)
-        self.container_stop_button.clicked.connect(self.stop_container)
-        self.container_restart_button.clicked.connect(self.reboot_container)
-        self.container_shutdown_button.clicked.connect(self.shutdown_container)
-
-        # Disable buttons when no item is selected
-        self.container_list.itemSelectionChanged.connect(self.update_container_button_state)
-        self.update_container_button_state()
-
-    def update_vm_button_state(self):
-        """Enable/disable VM buttons based on selection."""
-        enabled = bool(self.vm_list.selectedItems())
-        for btn in (self.vm_start_button, self.vm_stop_button, 
-                   self.vm_restart_button, self.vm_shutdown_button):
-            btn.setEnabled(enabled)
-
-    def update_container_button_state(self):
-        """Enable/disable container buttons based on selection."""
-        enabled = bool(self.container_list.selectedItems())
-        for btn in (self.container_start_button, self.container_stop_button,
-                   self.container_restart_button, self.container_shutdown_button):
-            btn.setEnabled(enabled)
-
-    def update_stats(self):
-        if not proxmox:
-            self.set_error_state()
-            self.vm_list.clear()
-            self.vm_list.addItem("Disconnected")
-            self.container_list.clear()
-            self.container_list.addItem("Disconnected")
-            return
-
-        try:
-            node = proxmox.nodes(PROXMOX_NODE)
-            status = node.status.get()
-
-            cpu_percent = status.get('cpu', 0.0) * 100
-            cpu_info = status.get('cpuinfo', {})
-            cores = cpu_info.get('cores', '?')
-            threads = cpu_info.get('cpus', '?')
-            self.pyve_cpu_label.setText(f'CPU ({cores} cores, {threads} threads)')
-            self.pyve_cpu_bar.setValue(int(cpu_percent))
-
-            ram_used = status.get('memory', {}).get('used', 0) / (1024**3)
-            ram_total = status.get('memory', {}).get('total', 1) / (1024**3)
-            ram_percent = (ram_used / ram_total) * 100 if ram_total > 0 else 0
-            self.pyve_ram_label.setText(f'RAM ({ram_used:.1f}/{ram_total:.1f} GiB)')
-            self.pyve_ram_bar.setValue(int(ram_percent))
-
-            disk_used = status.get('rootfs', {}).get('used', 0) / (1024**3)
-            disk_total = status.get('rootfs', {}).get('total', 1) / (1024**3)
-            disk_percent = (disk_used / disk_total) * 100 if disk_total > 0 else 0
-            self.pyve_disk_label.setText(f'Disk ({disk_used:.1f}/{disk_total:.1f} GiB)')
-            self.pyve_disk_bar.setValue(int(disk_percent))
-
-            io_delay = status.get('wait', 0.0) * 100
-            self.pyve_iodelay_label.setText('I/O Delay')
-            self.pyve_iodelay_bar.setFormat(f"{io_delay:.1f}%")
-            self.pyve_iodelay_bar.setValue(int(io_delay))
-
-            vms = node.qemu.get()
-            self.vm_list.clear()
-            for vm in sorted(vms, key=lambda x: x.get('vmid', 0)):
-                item_text = f"ID: {vm.get('vmid')} | {vm.get('name')} | {vm.get('status')}"
-                item = QListWidgetItem(item_text)
-                if vm.get('status') == "running":
-                    item.setBackground(QBrush(QColor("#4CAF50")))
-                    item.setForeground(QBrush(QColor("black")))
-                elif vm.get('status') == "stopped":
-                    item.setBackground(QBrush(QColor("#F44336")))
-                    item.setForeground(QBrush(QColor("white")))
-                self.vm_list.addItem(item)
-
-            containers = node.lxc.get()
-            self.container_list.clear()
-            for ct in sorted(containers, key=lambda x: x.get('vmid', 0)):
-                item_text = f"ID: {ct.get('vmid')} | {ct.get('name')} | {ct.get('status')}"
-                item = QListWidgetItem(item_text)
-                if ct.get('status') == "running":
-                    item.setBackground(QBrush(QColor("#4CAF50")))
-                    item.setForeground(QBrush(QColor("black")))
-                elif ct.get('status') == "stopped":
-                    item.setBackground(QBrush(QColor("#F44336")))
-                    item.setForeground(QBrush(QColor("white")))
-                self.container_list.addItem(item)
-        except ResourceException as e:
-            logger.error(f"Proxmox API error: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error in update_stats: {e}")
-
-    def _get_selected_vmid(self, list_widget, item_type):
-        selected = list_widget.selectedItems()
-        if not selected:
-            QMessageBox.warning(self, "Selection", f"Select a {item_type} first.")
-            return None
-        match = re.search(r'ID:\s*(\d+)', selected[0].text())
-        return int(match.group(1)) if match else None
-
-    def _perform_action(self, vmid, action_type, resource_type):
-        if vmid is None or not proxmox:
-            return
-        actions = {'start': 'start', 'stop': 'stop', 'reboot': 'reboot', 'shutdown': 'shutdown'}
-        try:
-            resource = (proxmox.nodes(PROXMOX_NODE).qemu(vmid) if resource_type == 'vm' 
-                       else proxmox.nodes(PROXMOX_NODE).lxc(vmid))
-            getattr(resource.status, actions[action_type]).post()
-            QTimer.singleShot(2000, self.update_stats)
-        except ResourceException as e:
-            QMessageBox.critical(self, "Error", f"Action failed: {e}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Unexpected error: {e}")
-
-    def start_vm(self): self._perform_action(self._get_selected_vmid(self.vm_list, "VM"), 'start', 'vm')
-    def stop_vm(self): self._perform_action(self._get_selected_vmid(self.vm_list, "VM"), 'stop', 'vm')
-    def reboot_vm(self): self._perform_action(self._get_selected_vmid(self.vm_list, "VM"), 'reboot', 'vm')
-    def shutdown_vm(self): self._perform_action(self._get_selected_vmid(self.vm_list, "VM"), 'shutdown', 'vm')
-
-    def start_container(self): self._perform_action(self._get_selected_vmid(self.container_list, "CT"), 'start', 'container')
-    def stop_container(self): self._perform_action(self._get_selected_vmid(self.container_list, "CT"), 'stop', 'container')
-    def reboot_container(self): self._perform_action(self._get_selected_vmid(self.container_list, "CT"), 'reboot', 'container')
-    def shutdown_container(self): self._perform_action(self._get_selected_vmid(self.container_list, "CT"), 'shutdown', 'container')
-
-if __name__ == '__main__':
-    app = QApplication(sys.argv)
-    if not initialize_proxmox_connection():
-        retry = QMessageBox.question(None, "Connection Error",
-                                     f"{connection_error_details}\nRetry connection?",
-                                     QMessageBox.Yes | QMessageBox.No)
-        if retry == QMessageBox.Yes:
-            if initialize_proxmox_connection():
-                monitor = MonitorApp()
-                monitor.setFixedSize(480, 800)  # Enforce 480x800 resolution
-                monitor.show()
-                sys.exit(app.exec_())
-        sys.exit(1)
-    monitor = MonitorApp()
-    monitor.setFixedSize(480, 800)  # Enforce 480x800 resolution
-    monitor.show()
+import sys
+import re
+import os
+import time
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QLabel,
+                             QMessageBox, QProgressBar, QTabWidget, QPushButton,
+                             QHBoxLayout, QListWidget, QSpacerItem, QSizePolicy,
+                             QListWidgetItem, QTabBar)
+from PyQt5.QtGui import QPalette, QColor, QFont, QBrush
+from PyQt5.QtCore import (Qt, QTimer, QPoint, QObject, QThread, QThreadPool,
+                          QRunnable, QSignalBlocker, pyqtSignal)
+from proxmoxer import ResourceException, ProxmoxAPI
+from requests.adapters import HTTPAdapter
+import logging
+
+# Configuration (use environment variables for security)
+PROXMOX_HOST = os.getenv('PROXMOX_HOST', 'your_proxmox_ip')
+PROXMOX_PORT = int(os.getenv('PROXMOX_PORT', 8006))
+PROXMOX_USER = os.getenv('PROXMOX_USER', 'your_user') #Example User: root@pam
+PROXMOX_PASSWORD = os.getenv('PROXMOX_PASSWORD', 'your_password')
+PROXMOX_NODE = os.getenv('PROXMOX_NODE', 'pve')
+VERIFY_SSL = os.getenv('PROXMOX_VERIFY_SSL', 'False').lower() == 'true'
+
+if not VERIFY_SSL:
+    import urllib3
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Adaptive polling: poll fast while things are changing, back off when
+# consecutive polls show no change. Spawned tasks (start/stop/...) are
+# watched at a short interval via their UPID instead of waiting for the
+# next full poll.
+POLL_FAST_MS = 5000
+POLL_IDLE_MS = 30000
+TASK_POLL_MS = 500
+
+# Cache freshness lifetimes: node status changes continuously, guest
+# listings only on state changes, so the latter can be kept longer.
+STATUS_TTL_S = 5
+GUEST_TTL_S = 15
+
+# Configure logging to console and file
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('monitor_app.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Compiled once; _get_selected_vmid runs it on every button click.
+_VMID_RE = re.compile(r'ID:\s*(\d+)')
+
+# Sort key for guest listings; cluster/resources always carries vmid.
+_BY_VMID = itemgetter('vmid')
+
+# Row template for the guest lists, interpolated once per row.
+_ROW_FMT = "ID: %s | %s | %s"
+
+def _build_palette():
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(45, 45, 45))
+    palette.setColor(QPalette.WindowText, Qt.white)
+    palette.setColor(QPalette.Base, QColor(35, 35, 35))
+    palette.setColor(QPalette.Button, QColor(65, 65, 65))
+    palette.setColor(QPalette.ButtonText, Qt.white)
+    palette.setColor(QPalette.Text, Qt.white)
+    palette.setColor(QPalette.Highlight, QColor(85, 85, 85))
+    palette.setColor(QPalette.HighlightedText, Qt.white)
+    return palette
+
+# Theme built once at import instead of per-window; the stylesheet
+# constant also lets Qt reuse its parsed rules across widgets.
+_DARK_PALETTE = _build_palette()
+
+_STYLESHEET = """
+    QWidget { font-size: 14pt; }
+    QPushButton {
+        padding: 6px; border: 1px solid #555; border-radius: 4px;
+        min-width: 100px; min-height: 40px; font-size: 14pt; color: white;
+    }
+    QPushButton:hover { border-color: #777; }
+    QPushButton:pressed { border-color: #999; }
+    QPushButton#startButton {
+        background-color: #4CAF50; color: black; font-weight: bold;
+    }
+    QPushButton#startButton:hover { background-color: #66BB6A; }
+    QPushButton#startButton:pressed { background-color: #388E3C; }
+    QPushButton#stopButton {
+        background-color: #F44336; color: black; font-weight: bold;
+    }
+    QPushButton#stopButton:hover { background-color: #EF5350; }
+    QPushButton#stopButton:pressed { background-color: #D32F2F; }
+    QPushButton#rebootButton {
+        background-color: #FFEB3B; color: black; font-weight: bold;
+    }
+    QPushButton#rebootButton:hover { background-color: #FFF176; }
+    QPushButton#rebootButton:pressed { background-color: #FBC02D; }
+    QPushButton#shutdownButton {
+        background-color: #FF9800; color: black; font-weight: bold;
+    }
+    QPushButton#shutdownButton:hover { background-color: #FFA726; }
+    QPushButton#shutdownButton:pressed { background-color: #F57C00; }
+    QListWidget {
+        border: 1px solid #4a4a4a; border-radius: 4px; font-size: 16pt; font-weight: bold;
+    }
+    QListWidget::item { height: 60px; }
+    QTabWidget::pane {
+        border: 1px solid #4a4a4a; background-color: #353535;
+    }
+    QTabBar::tab {
+        background-color: #505050; color: white; padding: 8px 16px;
+        border: 1px solid #4a4a4a; border-bottom: none;
+        border-top-left-radius: 4px; border-top-right-radius: 4px;
+        font-size: 14pt; min-width: 80px; min-height: 32px; font-weight: bold;
+    }
+    QTabBar::tab:selected {
+        background-color: #42a5f5; color: white; border-bottom: 1px solid #42a5f5;
+    }
+    QTabBar::tab:!selected:hover { background-color: #5e5e5e; }
+    QTabBar::tab:last {
+        background-color: #505050;
+    }
+    QTabBar::tab:last:selected {
+        background-color: #F44336;
+    }
+    QTabBar::tab:last:!selected:hover {
+        background-color: #EF5350;
+    }
+    QTabBar::scroller {
+        width: 80px;
+    }
+    QTabBar::left-arrow, QTabBar::right-arrow {
+        width: 48px; height: 48px; background: #505050;
+        border: 1px solid #4a4a4a; border-radius: 4px;
+    }
+    QTabBar::left-arrow:hover, QTabBar::right-arrow:hover {
+        background: #5e5e5e;
+    }
+    QTabBar::left-arrow:pressed, QTabBar::right-arrow:pressed {
+        background: #777;
+    }
+    QLabel { background-color: transparent; font-size: 14pt; }
+    QProgressBar {
+        border: 1px solid grey; border-radius: 4px; text-align: center;
+        background-color: #3a3a3a; height: 36px; font-size: 12pt;
+    }
+    QProgressBar::chunk { border-radius: 4px; }
+    #CpuBar::chunk { background-color: #42a5f5; }
+    #RamBar::chunk { background-color: #ef5350; }
+    #DiskBar::chunk { background-color: #66bb6a; }
+    #IoDelayBar::chunk { background-color: #ffca28; }
+"""
+
+# Global Proxmox connection
+proxmox = None
+connection_error_details = None
+
+def _tune_http_session(api):
+    """Pin keep-alive and a shared connection pool on the backend's
+    requests.Session so repeated polls reuse TLS connections instead of
+    paying a handshake per request."""
+    try:
+        session = api._store['session']
+    except (AttributeError, KeyError, TypeError):
+        logger.warning("Could not access proxmoxer session; skipping keep-alive tuning")
+        return
+    session.headers['Connection'] = 'keep-alive'
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+def initialize_proxmox_connection():
+    """Initialize connection to Proxmox server with retry logic."""
+    global proxmox, connection_error_details
+    max_retries = 3
+    for attempt in range(max_retries):
+        try:
+            proxmox = ProxmoxAPI(PROXMOX_HOST, port=PROXMOX_PORT, user=PROXMOX_USER,
+                                 password=PROXMOX_PASSWORD, verify_ssl=VERIFY_SSL,
+                                 timeout=10, backend='https')
+            _tune_http_session(proxmox)
+            proxmox.version.get()  # Test connection
+            logger.info(f"Connected to Proxmox host {PROXMOX_HOST} on node {PROXMOX_NODE}")
+            return True
+        except Exception as e:
+            connection_error_details = f"Proxmox connection error (attempt {attempt + 1}/{max_retries}): {e}"
+            logger.error(connection_error_details)
+            if attempt < max_retries - 1:
+                # Exponential backoff (0.5s, 1s) while keeping the GUI
+                # responsive instead of a flat blocking 2s sleep.
+                deadline = time.monotonic() + 0.5 * (2 ** attempt)
+                app = QApplication.instance()
+                while time.monotonic() < deadline:
+                    if app:
+                        app.processEvents()
+                    time.sleep(0.05)
+    return False
+
+class ProxmoxCache:
+    """TTL cache for Proxmox API responses, keyed by endpoint name.
+
+    Entries are kept past their freshness lifetime so a failed fetch can
+    fall back to the last known payload (flagged stale) instead of
+    blanking the UI."""
+    def __init__(self):
+        self._entries = {}  # key -> (monotonic timestamp, wall time, payload)
+
+    def get_or_fetch(self, key, ttl, loader):
+        """Return (payload, fetched) for key: the cached payload with
+        fetched=False if younger than ttl, otherwise the result of
+        loader(), stored and returned with fetched=True."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[2], False
+        payload = loader()
+        self._entries[key] = (time.monotonic(), time.time(), payload)
+        return payload, True
+
+    def invalidate(self, key):
+        """Expire the entry for key so the next get_or_fetch refetches,
+        but keep its payload available as a stale fallback."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries[key] = (float('-inf'), entry[1], entry[2])
+
+    def last(self, key):
+        """Return (wall time, payload) of the last successful fetch for
+        key regardless of freshness, or None if never fetched."""
+        entry = self._entries.get(key)
+        return None if entry is None else (entry[1], entry[2])
+
+proxmox_cache = ProxmoxCache()
+
+class ScrollableTabBar(QTabBar):
+    """Custom QTabBar with mouse/touch drag scrolling."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUsesScrollButtons(True)
+        self._drag_start_pos = None
+        self._scroll_offset = 0
+        self._total_tab_width = 0
+        self.setMouseTracking(True)
+
+    def _recalc_total_tab_width(self):
+        self._total_tab_width = sum(self.tabRect(i).width() for i in range(self.count()))
+
+    def tabInserted(self, index):
+        super().tabInserted(index)
+        self._recalc_total_tab_width()
+
+    def tabRemoved(self, index):
+        super().tabRemoved(index)
+        self._recalc_total_tab_width()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._recalc_total_tab_width()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._drag_start_pos = event.pos()
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if self._drag_start_pos is not None:
+            delta = event.pos().x() - self._drag_start_pos.x()
+            self._drag_start_pos = event.pos()
+            self.update_scroll_position(self._scroll_offset - delta)
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        self._drag_start_pos = None
+        super().mouseReleaseEvent(event)
+
+    def update_scroll_position(self, offset=None):
+        # Uses the width cached by tabInserted/tabRemoved/resizeEvent so
+        # this stays O(1) per mouse-move during a drag.
+        if offset is None:
+            offset = self._scroll_offset
+        total_width = self._total_tab_width
+        visible_width = self.width()
+
+        if total_width <= visible_width:
+            new_offset = 0
+        else:
+            max_offset = total_width - visible_width
+            new_offset = max(0, min(offset, max_offset))
+
+        if new_offset == self._scroll_offset:
+            return  # nothing moved; skip the repaint
+        self._scroll_offset = new_offset
+        self.update()  # Changed from repaint() to reduce flickering
+
+class ProxmoxWorker(QObject):
+    """Performs the blocking Proxmox API polling off the GUI thread."""
+    statsReady = pyqtSignal(dict)
+    pollFailed = pyqtSignal(str)
+    taskFinished = pyqtSignal(str, bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # The endpoints are independent, so fetch them concurrently:
+        # a poll costs max(RTT) instead of sum(RTT).
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
+    def poll(self):
+        """Fetch node status and guest listings, then emit the results."""
+        if not proxmox:
+            self.pollFailed.emit("Not connected")
+            return
+        try:
+            node = proxmox.nodes(PROXMOX_NODE)
+            futures = {
+                'status': self._executor.submit(
+                    proxmox_cache.get_or_fetch, 'status', STATUS_TTL_S, node.status.get),
+                'resources': self._executor.submit(
+                    proxmox_cache.get_or_fetch, 'resources', GUEST_TTL_S, self._fetch_guests),
+            }
+            status, _ = futures['status'].result()
+            (vms, containers), guests_fetched = futures['resources'].result()
+            payload = {
+                'status': status,
+                'vms': vms,
+                'containers': containers,
+                'stale': False,
+                # Whether the guest listing hit the API this tick; cache
+                # hits carry no new information for the backoff decision.
+                'guests_fetched': guests_fetched,
+            }
+            self.statsReady.emit(payload)
+        except ResourceException as e:
+            logger.error(f"Proxmox API error: {e}")
+            self._emit_stale_or_fail(str(e))
+        except Exception as e:
+            logger.error(f"Unexpected error while polling Proxmox: {e}")
+            self._emit_stale_or_fail(str(e))
+
+    def _emit_stale_or_fail(self, message):
+        """On fetch failure, fall back to the last known payload flagged
+        stale so transient outages don't blank the UI."""
+        status = proxmox_cache.last('status')
+        resources = proxmox_cache.last('resources')
+        if status is None or resources is None:
+            self.pollFailed.emit(message)
+            return
+        vms, containers = resources[1]
+        self.statsReady.emit({
+            'status': status[1],
+            'vms': vms,
+            'containers': containers,
+            'stale': True,
+            'stale_since': min(status[0], resources[0]),
+        })
+
+    def check_task(self, upid):
+        """Check whether a spawned task has finished; emits taskFinished."""
+        if not proxmox:
+            self.taskFinished.emit(upid, True)
+            return
+        try:
+            task = proxmox.nodes(PROXMOX_NODE).tasks(upid).status.get()
+            self.taskFinished.emit(upid, task.get('status') == 'stopped')
+        except Exception as e:
+            logger.error(f"Task status check failed for {upid}: {e}")
+            self.taskFinished.emit(upid, True)
+
+    @staticmethod
+    def _fetch_guests():
+        """List all VMs and containers in one cluster/resources round-trip,
+        partitioned client-side by resource type."""
+        resources = proxmox.cluster.resources.get(type='vm')
+        vms = []
+        containers = []
+        for r in resources:
+            if r.get('node') != PROXMOX_NODE:
+                continue
+            if r.get('type') == 'qemu':
+                vms.append(r)
+            elif r.get('type') == 'lxc':
+                containers.append(r)
+        return vms, containers
+
+class ActionSignals(QObject):
+    """Completion signals for an ActionRunnable (QRunnable is not a QObject)."""
+    finished = pyqtSignal(object)  # UPID returned by the POST, or None
+    failed = pyqtSignal(str)
+
+class ActionRunnable(QRunnable):
+    """Runs a blocking action POST on the global thread pool so button
+    clicks return immediately."""
+    def __init__(self, post):
+        super().__init__()
+        self.signals = ActionSignals()
+        self._post = post
+
+    def run(self):
+        try:
+            self.signals.finished.emit(self._post())
+        except Exception as e:
+            logger.error(f"Action failed: {e}")
+            self.signals.failed.emit(str(e))
+
+class MonitorApp(QWidget):
+    """Main application window for Proxmox monitoring and management."""
+
+    requestPoll = pyqtSignal()
+    requestTaskCheck = pyqtSignal(str)
+
+    # Shared brushes for guest status rows, built once instead of per item
+    # on every refresh.
+    _RUNNING_BG = QBrush(QColor("#4CAF50"))
+    _RUNNING_FG = QBrush(QColor("black"))
+    _STOPPED_BG = QBrush(QColor("#F44336"))
+    _STOPPED_FG = QBrush(QColor("white"))
+
+    def __init__(self):
+        super().__init__()
+        self.set_dark_theme()
+        self.init_ui()
+        self.setup_worker()
+        self.setup_update_timer()
+
+    def setup_worker(self):
+        """Move Proxmox polling to a dedicated thread so HTTPS round-trips
+        never block the event loop."""
+        self.worker_thread = QThread(self)
+        self.worker = ProxmoxWorker()
+        self.worker.moveToThread(self.worker_thread)
+        self.requestPoll.connect(self.worker.poll, Qt.QueuedConnection)
+        self.requestTaskCheck.connect(self.worker.check_task, Qt.QueuedConnection)
+        self.worker.statsReady.connect(self._apply_stats)
+        self.worker.pollFailed.connect(self._on_poll_failed)
+        self.worker.taskFinished.connect(self._on_task_finished)
+        self.worker_thread.start()
+
+    def closeEvent(self, event):
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        super().closeEvent(event)
+
+    def set_dark_theme(self):
+        self.setPalette(_DARK_PALETTE)
+        app = QApplication.instance()
+        if app:
+            app.setPalette(_DARK_PALETTE)
+
+    def init_ui(self):
+        self.setWindowTitle("PyVE Manager")
+        self.setWindowFlags(Qt.FramelessWindowHint)
+        self.setStyleSheet(_STYLESHEET)
+        
+        # Main layout
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(5, 5, 5, 5)
+        main_layout.setSpacing(5)
+
+        # Tab widget with custom scrollable tab bar
+        self.tabs = QTabWidget()
+        self.tabs.setTabBar(ScrollableTabBar())
+        self.tabs.setMovable(False)
+        self.tabs.setTabsClosable(False)
+
+        self.pyve_tab = QWidget()
+        self.vm_tab = QWidget()
+        self.container_tab = QWidget()
+        self.exit_tab = QWidget()
+
+        self.tabs.addTab(self.pyve_tab, "PyVE")
+        self.tabs.addTab(self.vm_tab, "VMs")
+        self.tabs.addTab(self.container_tab, "CTs")
+        self.exit_tab_index = self.tabs.addTab(self.exit_tab, "Exit")
+
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+
+        main_layout.addWidget(self.tabs)
+        self.setLayout(main_layout)
+
+        # Initialize tab contents
+        self.vm_list = QListWidget()
+        self.container_list = QListWidget()
+        # vmid -> QListWidgetItem, so refreshes mutate rows in place
+        # instead of rebuilding the lists.
+        self._vm_rows = {}
+        self._container_rows = {}
+        # Action runnables awaiting completion signals, plus per-type
+        # counts so button-state updates keep buttons disabled while a
+        # POST is in flight.
+        self._inflight_actions = set()
+        self._inflight_counts = {'vm': 0, 'container': 0}
+        # resource type -> action -> callable(vmid) returning the bound
+        # POST, built once per connection by _build_action_accessors.
+        self._action_posts = None
+        self.init_pyve_tab()
+        self.init_vm_tab()
+        self.init_container_tab()
+
+    def setup_update_timer(self):
+        self.update_timer = QTimer(self)
+        self.update_timer.timeout.connect(self.update_stats)
+        # Kick the worker for the initial fetch right away — it runs
+        # off-thread while the UI finishes laying out, so no delayed
+        # singleShot double-fire is needed.
+        self.update_stats()
+        self.update_timer.start(POLL_FAST_MS)
+
+    def on_tab_changed(self, index):
+        if index == self.exit_tab_index:
+            # The window is frameless, so this is the only exit path;
+            # close() runs closeEvent and stops the worker thread before
+            # the event loop goes away.
+            self.close()
+            QApplication.quit()
+
+    def init_pyve_tab(self):
+        layout = QVBoxLayout(self.pyve_tab)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(10)
+
+        layout.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Fixed))
+
+        stats_font = QFont()
+        stats_font.setPointSize(14)
+        stats_font.setBold(True)
+
+        initial_state = "Connecting..." if proxmox else "Error"
+        initial_cores_threads = "Fetching..." if proxmox else "N/A"
+        enabled = bool(proxmox)
+
+        self.pyve_cpu_label = QLabel(f'CPU ({initial_cores_threads})')
+        self.pyve_cpu_label.setFont(stats_font)
+        self.pyve_cpu_bar = QProgressBar()
+        self.pyve_cpu_bar.setObjectName("CpuBar")
+        self.pyve_cpu_bar.setTextVisible(True)
+        self.pyve_cpu_bar.setFormat("%p%")
+        self.pyve_cpu_bar.setValue(0)
+        self.pyve_cpu_bar.setEnabled(enabled)
+        layout.addWidget(self.pyve_cpu_label)
+        layout.addWidget(self.pyve_cpu_bar)
+
+        self.pyve_ram_label = QLabel(f'RAM: {initial_state}')
+        self.pyve_ram_label.setFont(stats_font)
+        self.pyve_ram_bar = QProgressBar()
+        self.pyve_ram_bar.setObjectName("RamBar")
+        self.pyve_ram_bar.setTextVisible(True)
+        self.pyve_ram_bar.setFormat("%p%")
+        self.pyve_ram_bar.setValue(0)
+        self.pyve_ram_bar.setEnabled(enabled)
+        layout.addWidget(self.pyve_ram_label)
+        layout.addWidget(self.pyve_ram_bar)
+
+        self.pyve_disk_label = QLabel(f'Disk: {initial_state}')
+        self.pyve_disk_label.setFont(stats_font)
+        self.pyve_disk_bar = QProgressBar()
+        self.pyve_disk_bar.setObjectName("DiskBar")
+        self.pyve_disk_bar.setTextVisible(True)
+        self.pyve_disk_bar.setFormat("%p%")
+        self.pyve_disk_bar.setValue(0)
+        self.pyve_disk_bar.setEnabled(enabled)
+        layout.addWidget(self.pyve_disk_label)
+        layout.addWidget(self.pyve_disk_bar)
+
+        self.pyve_iodelay_label = QLabel(f'I/O Delay: {initial_state}')
+        self.pyve_iodelay_label.setFont(stats_font)
+        self.pyve_iodelay_bar = QProgressBar()
+        self.pyve_iodelay_bar.setObjectName("IoDelayBar")
+        self.pyve_iodelay_bar.setTextVisible(True)
+        self.pyve_iodelay_bar.setFormat("%p%")
+        self.pyve_iodelay_bar.setValue(0)
+        self.pyve_iodelay_bar.setEnabled(enabled)
+        layout.addWidget(self.pyve_iodelay_label)
+        layout.addWidget(self.pyve_iodelay_bar)
+
+        layout.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Expanding))
+
+        if not proxmox:
+            self.set_error_state()
+
+    def set_error_state(self):
+        self.pyve_cpu_label.setText("CPU (N/A)")
+        self.pyve_ram_label.setText("RAM: Error")
+        self.pyve_disk_label.setText("Disk: Error")
+        self.pyve_iodelay_label.setText("I/O Delay: Error")
+
+    def init_vm_tab(self):
+        layout = QVBoxLayout(self.vm_tab)
+        layout.setContentsMargins(5, 5, 5, 5)
+        layout.setSpacing(5)
+        
+        self.vm_list.setWordWrap(True)
+        # All rows are 60px by stylesheet; lets the viewport skip
+        # per-item height queries.
+        self.vm_list.setUniformItemSizes(True)
+        layout.addWidget(self.vm_list)
+
+        buttons_layout = QHBoxLayout()
+        buttons_layout.setSpacing(8)
+        
+        self.vm_start_button = QPushButton('Start')
+        self.vm_start_button.setObjectName("startButton")
+        self.vm_stop_button = QPushButton('Stop')
+        self.vm_stop_button.setObjectName("stopButton")
+        self.vm_restart_button = QPushButton('Reboot')
+        self.vm_restart_button.setObjectName("rebootButton")
+        self.vm_shutdown_button = QPushButton('Shutdown')
+        self.vm_shutdown_button.setObjectName("shutdownButton")
+
+        self._vm_action_buttons = (self.vm_start_button, self.vm_stop_button,
+                                   self.vm_restart_button, self.vm_shutdown_button)
+        for btn in self._vm_action_buttons:
+            buttons_layout.addWidget(btn)
+        layout.addLayout(buttons_layout)
+
+        for action, btn in zip(('start', 'stop', 'reboot', 'shutdown'),
+                               self._vm_action_buttons):
+            btn.clicked.connect(lambda _=False, a=action: self._on_action_clicked(a, 'vm'))
+
+        # Disable buttons when no item is selected
+        self.vm_list.itemSelectionChanged.connect(self.update_vm_button_state)
+        self.update_vm_button_state()
+
+    def init_container_tab(self):
+        layout = QVBoxLayout(self.container_tab)
+        layout.setContentsMargins(5, 5, 5, 5)
+        layout.setSpacing(5)
+        
+        self.container_list.setWordWrap(True)
+        # All rows are 60px by stylesheet; lets the viewport skip
+        # per-item height queries.
+        self.container_list.setUniformItemSizes(True)
+        layout.addWidget(self.container_list)
+
+        buttons_layout = QHBoxLayout()
+        buttons_layout.setSpacing(8)
+        
+        self.container_start_button = QPushButton('Start')
+        self.container_start_button.setObjectName("startButton")
+        self.container_stop_button = QPushButton('Stop')
+        self.container_stop_button.setObjectName("stopButton")
+        self.container_restart_button = QPushButton('Reboot')
+        self.container_restart_button.setObjectName("rebootButton")
+        self.container_shutdown_button = QPushButton('Shutdown')
+        self.container_shutdown_button.setObjectName("shutdownButton")
+
+        self._container_action_buttons = (self.container_start_button,
+                                          self.container_stop_button,
+                                          self.container_restart_button,
+                                          self.container_shutdown_button)
+        for btn in self._container_action_buttons:
+            buttons_layout.addWidget(btn)
+        layout.addLayout(buttons_layout)
+
+        for action, btn in zip(('start', 'stop', 'reboot', 'shutdown'),
+                               self._container_action_buttons):
+            btn.clicked.connect(lambda _=False, a=action: self._on_action_clicked(a, 'container'))
+
+        # Disable buttons when no item is selected
+        self.container_list.itemSelectionChanged.connect(self.update_container_button_state)
+        self.update_container_button_state()
+
+    def update_vm_button_state(self):
+        """Enable/disable VM buttons based on selection and in-flight actions."""
+        enabled = (bool(self.vm_list.selectedItems())
+                   and not self._inflight_counts['vm'])
+        for btn in self._vm_action_buttons:
+            btn.setEnabled(enabled)
+
+    def update_container_button_state(self):
+        """Enable/disable container buttons based on selection and in-flight actions."""
+        enabled = (bool(self.container_list.selectedItems())
+                   and not self._inflight_counts['container'])
+        for btn in self._container_action_buttons:
+            btn.setEnabled(enabled)
+
+    def update_stats(self):
+        """Request a poll from the worker thread; results arrive via _apply_stats."""
+        if not proxmox:
+            self.set_error_state()
+            self.vm_list.clear()
+            self._vm_rows.clear()
+            self.vm_list.addItem("Disconnected")
+            self.container_list.clear()
+            self._container_rows.clear()
+            self.container_list.addItem("Disconnected")
+            return
+        self.requestPoll.emit()
+
+    def _on_poll_failed(self, message):
+        if not proxmox:
+            self.set_error_state()
+
+    def _apply_stats(self, payload):
+        """Render a poll result on the GUI thread (connected to statsReady)."""
+        try:
+            status = payload['status']
+            stale = payload.get('stale', False)
+            stale_suffix = ''
+            if stale:
+                stale_suffix = time.strftime(' (stale since %H:%M)',
+                                             time.localtime(payload['stale_since']))
+
+            cpu_percent = status.get('cpu', 0.0) * 100
+            cpu_info = status.get('cpuinfo', {})
+            cores = cpu_info.get('cores', '?')
+            threads = cpu_info.get('cpus', '?')
+            self.pyve_cpu_label.setText(f'CPU ({cores} cores, {threads} threads){stale_suffix}')
+            self.pyve_cpu_bar.setValue(int(cpu_percent))
+
+            ram_used = status.get('memory', {}).get('used', 0) / (1024**3)
+            ram_total = status.get('memory', {}).get('total', 1) / (1024**3)
+            ram_percent = (ram_used / ram_total) * 100 if ram_total > 0 else 0
+            self.pyve_ram_label.setText(f'RAM ({ram_used:.1f}/{ram_total:.1f} GiB){stale_suffix}')
+            self.pyve_ram_bar.setValue(int(ram_percent))
+
+            disk_used = status.get('rootfs', {}).get('used', 0) / (1024**3)
+            disk_total = status.get('rootfs', {}).get('total', 1) / (1024**3)
+            disk_percent = (disk_used / disk_total) * 100 if disk_total > 0 else 0
+            self.pyve_disk_label.setText(f'Disk ({disk_used:.1f}/{disk_total:.1f} GiB){stale_suffix}')
+            self.pyve_disk_bar.setValue(int(disk_percent))
+
+            io_delay = status.get('wait', 0.0) * 100
+            self.pyve_iodelay_label.setText(f'I/O Delay{stale_suffix}')
+            self.pyve_iodelay_bar.setFormat(f"{io_delay:.1f}%")
+            self.pyve_iodelay_bar.setValue(int(io_delay))
+
+            vms_changed = self._refresh_guest_list(self.vm_list, self._vm_rows,
+                                                   payload['vms'])
+            cts_changed = self._refresh_guest_list(self.container_list,
+                                                   self._container_rows,
+                                                   payload['containers'])
+            # Selection signals were blocked during the diffs; sync the
+            # button state once per refresh instead of once per row.
+            self.update_vm_button_state()
+            self.update_container_button_state()
+            # Back off while nothing is happening; speed up on any change.
+            # While serving stale data, keep polling fast to recover sooner.
+            # Cache-served polls saw no fresh data, so only a tick that
+            # actually refetched the guest listing may trigger the backoff.
+            if stale or vms_changed or cts_changed:
+                interval = POLL_FAST_MS
+            elif payload.get('guests_fetched', True):
+                interval = POLL_IDLE_MS
+            else:
+                interval = self.update_timer.interval()
+            if self.update_timer.interval() != interval:
+                self.update_timer.start(interval)
+        except Exception as e:
+            logger.error(f"Unexpected error in _apply_stats: {e}")
+
+    def _refresh_guest_list(self, list_widget, rows, guests):
+        """Diff-update a guest list in place: reuse existing rows keyed by
+        vmid so selection survives refreshes and unchanged rows don't
+        repaint, instead of clear()-ing and rebuilding every tick.
+
+        Returns True if any guest appeared, disappeared, or changed state."""
+        changed = False
+        # Blocking signals keeps itemSelectionChanged from firing a button-
+        # state update per inserted/removed row; the caller refreshes the
+        # button state once afterwards.
+        blocker = QSignalBlocker(list_widget)
+        list_widget.setUpdatesEnabled(False)  # batch into one repaint
+        try:
+            sorted_guests = sorted(guests, key=_BY_VMID)
+            # Remove vanished rows first so the enumeration index below is
+            # a correct widget position for every insert.
+            current = {guest['vmid'] for guest in sorted_guests}
+            for vmid in [v for v in rows if v not in current]:
+                changed = True
+                item = rows.pop(vmid)
+                list_widget.takeItem(list_widget.row(item))
+            for index, guest in enumerate(sorted_guests):
+                # vmid/name/status are always present in Proxmox responses.
+                vmid = guest['vmid']
+                name = guest['name']
+                status = guest['status']
+                item_text = _ROW_FMT % (vmid, name, status)
+                item = rows.get(vmid)
+                if item is None:
+                    item = QListWidgetItem(item_text)
+                    list_widget.insertItem(index, item)
+                    rows[vmid] = item
+                if item.data(Qt.UserRole) != status:
+                    changed = True
+                    item.setText(item_text)
+                    if status == "running":
+                        item.setBackground(self._RUNNING_BG)
+                        item.setForeground(self._RUNNING_FG)
+                    elif status == "stopped":
+                        item.setBackground(self._STOPPED_BG)
+                        item.setForeground(self._STOPPED_FG)
+                    item.setData(Qt.UserRole, status)
+                elif item.text() != item_text:  # e.g. guest renamed
+                    item.setText(item_text)
+        finally:
+            list_widget.setUpdatesEnabled(True)
+            blocker.unblock()
+        return changed
+
+    def _watch_task(self, upid):
+        """Short-poll a spawned task's UPID until it completes, then
+        refresh once — instead of a fixed 2s delayed full poll."""
+        if upid:
+            QTimer.singleShot(TASK_POLL_MS, lambda: self.requestTaskCheck.emit(upid))
+        else:
+            self.update_stats()
+
+    def _on_task_finished(self, upid, finished):
+        if finished:
+            proxmox_cache.invalidate('resources')
+            self.update_stats()
+        else:
+            QTimer.singleShot(TASK_POLL_MS, lambda: self.requestTaskCheck.emit(upid))
+
+    def _get_selected_vmid(self, list_widget, item_type):
+        selected = list_widget.selectedItems()
+        if not selected:
+            QMessageBox.warning(self, "Selection", f"Select a {item_type} first.")
+            return None
+        match = _VMID_RE.search(selected[0].text())
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def _build_action_accessors():
+        """Specialize the proxmoxer attribute chains once per connection:
+        each entry maps a vmid to the bound POST for its action, replacing
+        the per-click dict lookup plus getattr dance."""
+        node = proxmox.nodes(PROXMOX_NODE)
+        action_names = ('start', 'stop', 'reboot', 'shutdown')
+        return {
+            'vm': {a: (lambda v, _a=a: getattr(node.qemu(v).status, _a).post)
+                   for a in action_names},
+            'container': {a: (lambda v, _a=a: getattr(node.lxc(v).status, _a).post)
+                          for a in action_names},
+        }
+
+    def _perform_action(self, vmid, action_type, resource_type):
+        if vmid is None or not proxmox:
+            return
+        if self._action_posts is None:
+            self._action_posts = self._build_action_accessors()
+        post = self._action_posts[resource_type][action_type](vmid)
+        # Count the POST as in flight before disabling: the button-state
+        # updaters check the count, so a refresh or selection change
+        # landing mid-POST can no longer re-enable the buttons early.
+        self._inflight_counts[resource_type] += 1
+        self._restore_action_buttons(resource_type)
+        task = ActionRunnable(post)
+        task.signals.finished.connect(
+            lambda upid, rt=resource_type, t=task: self._on_action_posted(upid, rt, t))
+        task.signals.failed.connect(
+            lambda message, rt=resource_type, t=task: self._on_action_failed(message, rt, t))
+        # Keep the runnable referenced until its signal fires; the pool's
+        # autoDelete only covers the C++ side.
+        self._inflight_actions.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _restore_action_buttons(self, resource_type):
+        if resource_type == 'vm':
+            self.update_vm_button_state()
+        else:
+            self.update_container_button_state()
+
+    def _on_action_posted(self, upid, resource_type, task):
+        self._inflight_actions.discard(task)
+        self._inflight_counts[resource_type] -= 1
+        self._restore_action_buttons(resource_type)
+        # Drop the guest listing so the follow-up refresh refetches it
+        # while the node status stays cached.
+        proxmox_cache.invalidate('resources')
+        self._watch_task(upid if isinstance(upid, str) else None)
+
+    def _on_action_failed(self, message, resource_type, task):
+        self._inflight_actions.discard(task)
+        self._inflight_counts[resource_type] -= 1
+        self._restore_action_buttons(resource_type)
+        QMessageBox.critical(self, "Error", f"Action failed: {message}")
+
+    def _on_action_clicked(self, action_type, resource_type):
+        """Single click handler for all eight action buttons."""
+        if resource_type == 'vm':
+            vmid = self._get_selected_vmid(self.vm_list, "VM")
+        else:
+            vmid = self._get_selected_vmid(self.container_list, "CT")
+        self._perform_action(vmid, action_type, resource_type)
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    if not initialize_proxmox_connection():
+        retry = QMessageBox.question(None, "Connection Error",
+                                     f"{connection_error_details}\nRetry connection?",
+                                     QMessageBox.Yes | QMessageBox.No)
+        if retry == QMessageBox.Yes:
+            if initialize_proxmox_connection():
+                monitor = MonitorApp()
+                monitor.setFixedSize(480, 800)  # Enforce 480x800 resolution
+                monitor.show()
+                sys.exit(app.exec_())
+        sys.exit(1)
+    monitor = MonitorApp()
+    monitor.setFixedSize(480, 800)  # Enforce 480x800 resolution
+    monitor.show()
     sys.exit(app.exec_())
\ No newline at end of file